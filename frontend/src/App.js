@@ -41,6 +41,30 @@ const colorCaches = {
   location: new Map()
 };
 
+// Per-node adjacency maps exported by the survey tool ({id: name, ...}).
+// They duplicate the edge list several times over and are not needed for
+// rendering or analysis.
+const DERIVED_NODE_FIELDS = ['neighbors', 'in_neighbors', 'out_neighbors'];
+
+// Remove derived adjacency maps in place, returning how many were dropped.
+// Malformed input is left untouched for the server's upload validation.
+const stripDerivedNodeFields = (nodes) => {
+  if (!Array.isArray(nodes)) return 0;
+  let stripped = 0;
+  nodes.forEach(node => {
+    const data = node && node.data;
+    if (!data || typeof data !== 'object') return;
+    DERIVED_NODE_FIELDS.forEach(field => {
+      const value = data[field];
+      if (value && typeof value === 'object' && !Array.isArray(value)) {
+        delete data[field];
+        stripped++;
+      }
+    });
+  });
+  return stripped;
+};
+
 // Generate a diverse color palette
 const generateColorPalette = (count) => {
   const colors = [];
@@ -913,6 +937,11 @@ function Home() {
       }
       
       console.log(`Graph contains ${graphData.nodes.length} nodes and ${graphData.edges.length} edges`);
+
+      const strippedFields = stripDerivedNodeFields(graphData.nodes);
+      if (strippedFields > 0) {
+        console.log(`Dropped ${strippedFields} derived neighbor maps before upload`);
+      }
       
       const response = await fetch(`${API}/upload-graph`, {
         method: 'POST',